@@ -248,38 +248,40 @@ func match(val Scmer, pattern Scmer, en *Env) bool {
 					// for additional info, see https://github.com/google/re2/wiki/Syntax
 					switch v := valueFromPattern(val, en).(type) {
 						case string: // only allowed for strings
+							var re *regexp.Regexp
 							switch p1 := valueFromPattern(p[1], en).(type) {
 								case string:
-									re, err := regexp.Compile(p1)
+									var err error
+									re, err = regexp.Compile(p1)
 									if err != nil {
 										panic(err)
 									}
-									if re.NumSubexp() != len(p) - 3 {
-										panic("regex " + p1 + " contains " + fmt.Sprint(re.NumSubexp()) + " subexpressions, found " + fmt.Sprint(len(p)))
-									}
-									match := re.FindStringSubmatch(v)
-									if match != nil {
-										for i := 0; i <= re.NumSubexp(); i++ {
-											if p[i+2] != Symbol("_") {
-												switch v := p[i+2].(type) {
-													case NthLocalVar:
-														en.VarsNumbered[v] = match[i]
-													case Symbol:
-														en.Vars[v] = match[i]
-													default:
-														panic("regex variable invalid: "+SerializeToString(v, en))
-												}
-											}
-										}
-										return true
-									} else {
-										return false
-									}
 								case *regexp.Regexp:
-									panic("TODO: precompiled regexp from optimize()")
+									re = p1 // precompiled by optimize()
 								default:
 									panic("regex expects string")
 							}
+							if re.NumSubexp() != len(p) - 3 {
+								panic("regex " + re.String() + " contains " + fmt.Sprint(re.NumSubexp()) + " subexpressions, found " + fmt.Sprint(len(p)))
+							}
+							match := re.FindStringSubmatch(v)
+							if match != nil {
+								for i := 0; i <= re.NumSubexp(); i++ {
+									if p[i+2] != Symbol("_") {
+										switch v := p[i+2].(type) {
+											case NthLocalVar:
+												en.VarsNumbered[v] = match[i]
+											case Symbol:
+												en.Vars[v] = match[i]
+											default:
+												panic("regex variable invalid: "+SerializeToString(v, en))
+										}
+									}
+								}
+								return true
+							} else {
+								return false
+							}
 						default:
 							return false // non-strings are not matching regex
 					}
@@ -16,6 +16,7 @@ Copyright (C) 2024  Carl-Philip Hänsch
 */
 package scm
 
+import "regexp"
 
 var SettingsHaveGoodBacktraces bool
 
@@ -361,6 +362,16 @@ func OptimizeMatchPattern(value Scmer, pattern Scmer, env *Env, ome *optimizerMe
 		} else if p[0] == Symbol("var") {
 			// expand (it is faster)
 			return NthLocalVar(ToInt(p[1]))
+		} else if p[0] == Symbol("regex") {
+			if s, ok := p[1].(string); ok {
+				// precompile constant regexes so match does not recompile them on every call
+				if re, err := regexp.Compile(s); err == nil {
+					p[1] = re
+				}
+			}
+			for i := 2; i < len(p); i++ {
+				p[i] = OptimizeMatchPattern(nil, p[i], env, ome, ome2)
+			}
 		} else {
 			for i := 1; i < len(p); i++ {
 				p[i] = OptimizeMatchPattern(nil, p[i], env, ome, ome2)
@@ -21,6 +21,7 @@ package scm
 import (
 	"fmt"
 	"bytes"
+	"regexp"
 	"strings"
 	"reflect"
 )
@@ -167,6 +168,9 @@ func SerializeEx(b *bytes.Buffer, v Scmer, en *Env, glob *Env, p *Proc) {
 		b.WriteByte('"')
 		b.WriteString(strings.NewReplacer("\"", "\\\"", "\\", "\\\\", "\r", "\\r", "\n", "\\n").Replace(v))
 		b.WriteByte('"')
+	case *regexp.Regexp:
+		// precompiled regex from optimize(): serialize its source string
+		SerializeEx(b, v.String(), en, glob, p)
 	case nil:
 		b.WriteString("nil")
 	default: